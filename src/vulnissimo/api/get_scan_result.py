@@ -1,7 +1,7 @@
 """Contains methods for getting a scan result from the Vulnissimo API"""
 
 from http import HTTPStatus
-from typing import Any, Union
+from typing import Any, Optional, Union
 from uuid import UUID
 
 import httpx
@@ -14,7 +14,11 @@ from ..types import Response
 
 def _get_kwargs(
     scan_id: UUID,
+    *,
+    if_none_match: Optional[str] = None,
 ) -> dict[str, Any]:
+    headers: dict[str, Any] = {}
+
     params: dict[str, Any] = {}
 
     params = {k: v for k, v in params.items() if v is not None}
@@ -25,15 +29,22 @@ def _get_kwargs(
         "params": params,
     }
 
+    if if_none_match is not None:
+        headers["If-None-Match"] = if_none_match
+
+    _kwargs["headers"] = headers
     return _kwargs
 
 
-def _parse_response(*, response: httpx.Response) -> ScanResult:
+def _parse_response(*, response: httpx.Response) -> Optional[ScanResult]:
     status_code = HTTPStatus(response.status_code)
 
     if status_code == HTTPStatus.OK:
         return ScanResult(**response.json())
 
+    if status_code == HTTPStatus.NOT_MODIFIED:
+        return None
+
     if 400 <= status_code < 500:
         if status_code == HTTPStatus.NOT_FOUND:
             data = ExceptionResponseData(**response.json())
@@ -61,6 +72,7 @@ def sync_detailed(
     scan_id: UUID,
     *,
     client: Union[AuthenticatedClient, Client],
+    if_none_match: Optional[str] = None,
 ) -> Response[ScanResult]:
     """
     Get scan result
@@ -69,6 +81,8 @@ def sync_detailed(
 
     Args:
         scan_id (UUID):
+        if_none_match (Optional[str]): ETag of a previously fetched scan result. If the scan
+            result has not changed since, Vulnissimo returns 304 Not Modified and `parsed` is None.
 
     Raises:
         errors.NotFoundError: If Vulnissimo returns 404 Not Found.
@@ -80,6 +94,7 @@ def sync_detailed(
 
     kwargs = _get_kwargs(
         scan_id=scan_id,
+        if_none_match=if_none_match,
     )
 
     response = client.get_httpx_client().request(
@@ -117,12 +132,18 @@ async def asyncio_detailed(
     scan_id: UUID,
     *,
     client: Union[AuthenticatedClient, Client],
+    if_none_match: Optional[str] = None,
 ) -> Response[ScanResult]:
     """
     Get scan result
 
      View a scan result by its ID
 
+    Args:
+        scan_id (UUID):
+        if_none_match (Optional[str]): ETag of a previously fetched scan result. If the scan
+            result has not changed since, Vulnissimo returns 304 Not Modified and `parsed` is None.
+
     Raises:
         errors.NotFoundError: If Vulnissimo returns 404 Not Found.
         errors.UnprocessableEntityError: If Vulnissimo returns 422 Unprocessable Entity.
@@ -133,6 +154,7 @@ async def asyncio_detailed(
 
     kwargs = _get_kwargs(
         scan_id=scan_id,
+        if_none_match=if_none_match,
     )
 
     response = await client.get_async_httpx_client().request(**kwargs)
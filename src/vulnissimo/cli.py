@@ -1,21 +1,15 @@
 """The CLI module for Vulnissimo."""
 
-import json
-import time
+import asyncio
+from collections.abc import AsyncIterator
+from http import HTTPStatus
 from typing import Annotated
 from uuid import UUID
 
 import typer
+from rich import get_console
 from rich import print as rich_print
-from rich import print_json
-from rich.progress import (
-    BarColumn,
-    Progress,
-    TaskProgressColumn,
-    TextColumn,
-    TimeElapsedColumn,
-)
-from rich.prompt import Prompt
+from rich.highlighter import JSONHighlighter
 
 from .api import get_scan_result, run_scan
 from .client import Client
@@ -24,6 +18,12 @@ from .models import ScanCreate, ScanResult, ScanStatus
 
 app = typer.Typer(no_args_is_help=True)
 
+POLL_INTERVAL_MIN = 0.25
+POLL_INTERVAL_MAX = 4.0
+POLL_INTERVAL_BACKOFF = 1.5
+
+JSON_HIGHLIGHTER = JSONHighlighter()
+
 
 def get_client():
     """Get a basic client for the Vulnissimo api"""
@@ -37,7 +37,9 @@ def get(
     output_file: Annotated[
         str | None, typer.Option(help="File to write scan result to")
     ] = None,
-    indent: Annotated[int, typer.Option(help="Indentation of the JSON output")] = 2,
+    indent: Annotated[
+        int, typer.Option(min=0, help="Indentation of the JSON output")
+    ] = 2,
 ):
     """Get scan by ID"""
 
@@ -55,60 +57,115 @@ def run(
     output_file: Annotated[
         str | None, typer.Option(help="File to write scan result to")
     ] = None,
-    indent: Annotated[int, typer.Option(help="Indentation of the JSON output")] = 2,
+    indent: Annotated[
+        int, typer.Option(min=0, help="Indentation of the JSON output")
+    ] = 2,
 ):
     """Run a scan on a given target"""
 
     try:
-        with get_client() as client:
-            started_scan = run_scan.sync(client=client, body=ScanCreate(target=target))
-            rich_print(f"Scan started on {target}.")
-            rich_print(f"See live updates at {started_scan.html_result}.")
-
-            progress_columns = [
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TaskProgressColumn(),
-                TimeElapsedColumn(),
-            ]
-
-            with Progress(*progress_columns) as progress_bar:
-                task_id = progress_bar.add_task("Scanning...")
-                scan_progress = 0
-
-                while True:
-                    scan = get_scan_result.sync(scan_id=started_scan.id, client=client)
-                    new_scan_progress = scan.scan_info.progress
-                    scan_progress_diff = new_scan_progress - scan_progress
-                    if scan_progress_diff != 0:
-                        progress_bar.update(task_id, advance=scan_progress_diff)
-                    scan_progress = new_scan_progress
-                    if scan.scan_info.status == ScanStatus.FINISHED:
-                        break
-                    time.sleep(2)
-
+        scan = asyncio.run(_run_scan(target))
         output_scan(scan, output_file, indent)
-
     except APIError as e:
         rich_print(f"[red]{str(e)}[/red]")
 
 
+async def _run_scan(target: str) -> ScanResult:
+    """Start a scan on `target` and show its progress until it is finished"""
+
+    from rich.progress import (
+        BarColumn,
+        Progress,
+        TaskProgressColumn,
+        TextColumn,
+        TimeElapsedColumn,
+    )
+
+    async with get_client() as client:
+        started_scan = await run_scan.asyncio(
+            client=client, body=ScanCreate(target=target)
+        )
+        rich_print(f"Scan started on {target}.")
+        rich_print(f"See live updates at {started_scan.html_result}.")
+
+        progress_columns = [
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            TimeElapsedColumn(),
+        ]
+
+        with Progress(*progress_columns, auto_refresh=False) as progress_bar:
+            task_id = progress_bar.add_task("Scanning...")
+            scan_progress = 0
+
+            async for scan in _wait_for_scan(client, started_scan.id):
+                new_scan_progress = scan.scan_info.progress
+                if new_scan_progress != scan_progress:
+                    progress_bar.update(task_id, completed=new_scan_progress)
+                    scan_progress = new_scan_progress
+                progress_bar.refresh()
+
+    return scan
+
+
+async def _wait_for_scan(client: Client, scan_id: UUID) -> AsyncIterator[ScanResult]:
+    """
+    Poll a scan until it is finished, yielding every fetched scan result.
+
+    The delay between polls grows while the scan progress stays the same and is reset as soon
+    as the progress advances. Polls are conditional on the ETag of the last scan result, so an
+    unchanged scan result is neither transferred nor parsed again.
+    """
+
+    delay = POLL_INTERVAL_MIN
+    scan_progress = None
+    etag = None
+
+    while True:
+        response = await get_scan_result.asyncio_detailed(
+            scan_id=scan_id, client=client, if_none_match=etag
+        )
+        if response.status_code != HTTPStatus.NOT_MODIFIED:
+            scan = response.parsed
+            etag = response.headers.get("ETag")
+        yield scan
+        scan_info = scan.scan_info
+        if scan_info.status == ScanStatus.FINISHED:
+            return
+
+        new_scan_progress = scan_info.progress
+        if new_scan_progress != scan_progress:
+            delay = POLL_INTERVAL_MIN
+        else:
+            delay = min(delay * POLL_INTERVAL_BACKOFF, POLL_INTERVAL_MAX)
+        scan_progress = new_scan_progress
+        await asyncio.sleep(delay)
+
+
 def output_scan(scan: ScanResult, output_file: str | None, indent: int):
     """
     If `output_file` is provided, write the scan to `output_file`. Else, print it to the console
     """
 
+    # Serialize once up front, so prompting for another file name does not serialize again
+    scan_json = scan.model_dump_json(indent=indent)
+
     while True:
         if not output_file:
-            print_json(scan.model_dump_json(), indent=indent)
+            # Highlight pydantic's indented output directly instead of having print_json
+            # parse and re-serialize it, printing with soft wrap as print_json does
+            get_console().print(JSON_HIGHLIGHTER(scan_json), soft_wrap=True)
             return
 
         try:
             with open(output_file, "w+", encoding="UTF-8") as f:
-                json.dump(scan.model_dump(mode="json"), f, indent=indent)
+                f.write(scan_json)
             rich_print(f"Scan result was written to {output_file}.")
             return
         except PermissionError as e:
+            from rich.prompt import Prompt
+
             rich_print(f"[red]Could not open file for writing: {e.strerror}.[/red]")
             output_file = Prompt.ask(
                 "Enter another file name for writing"